@@ -160,7 +160,7 @@ class DeviceDetector:
         return self._ua_spaceless
 
     def get_parse_cache(self) -> Self | None:
-        cached = DDCache['user_agents'].get(self.ua_hash, {}).get('parsed') or None
+        cached = DDCache['user_agents'].get((self.ua_hash, 'parsed'), None)
         if cached:
             self.os = cached.os
             self.client = cached.client
@@ -175,10 +175,7 @@ class DeviceDetector:
 
     def set_parse_cache(self) -> Self:
         if self.all_details:
-            try:
-                DDCache['user_agents'][self.ua_hash]['parsed'] = self
-            except KeyError:
-                DDCache['user_agents'][self.ua_hash] = {'parsed': self}
+            DDCache['user_agents'][(self.ua_hash, 'parsed')] = self
         return self
 
     # -----------------------------------------------------------------------------
@@ -41,13 +41,14 @@ class BaseClientParser(Parser):
         Extract key/value pairs from User Agent String, based on various patterns of:
         <name><sep><version>
         """
-        cached = DDCache['user_agents'][self.ua_hash].get('name_version_pairs', None)
+        cache_key = (self.ua_hash, 'name_version_pairs')
+        cached = DDCache['user_agents'].get(cache_key, None)
         if cached is not None:
             return cached
 
         name_version_pairs = key_value_pairs(ua=self.user_agent)
 
-        DDCache['user_agents'][self.ua_hash]['name_version_pairs'] = name_version_pairs
+        DDCache['user_agents'][cache_key] = name_version_pairs
         return name_version_pairs
 
     def matches_manual_appdetails(self) -> bool:
@@ -100,7 +101,7 @@ class BaseClientParser(Parser):
         Prefer client hints over user agent data generally.
         Override on subclasses to customize order
         """
-        if self.ua_data and self.ch_client_data:
+        if self._has_hints and self.ua_data:
             self.ua_data |= self.ch_client_data
 
     def dtype(self) -> AppType | str:
@@ -172,8 +173,9 @@ class GenericClientParser(BaseClientParser):
         return 1 < len(self.app_name) <= 45
 
     def is_substring_unwanted(self) -> bool:
+        app_name = self.app_name.lower()
         for substring in self.unwanted_substrings:
-            if substring in self.app_name.lower():
+            if substring in app_name:
                 return True
 
         return False
@@ -1,6 +1,6 @@
-import regex
+from functools import lru_cache
+import re
 from device_detector.enums import AppType
-from device_detector.lazy_regex import RegexLazy
 from . import BaseClientParser
 from ...settings import BOUNDED_REGEX
 from ..settings import (
@@ -8,6 +8,7 @@ from ..settings import (
     AVAILABLE_ENGINES,
     BROWSER_FAMILIES,
     BROWSER_TO_ABBREV,
+    BROWSER_NAME_TO_ABBREV,
     FAMILY_FROM_ABBREV,
     CHECK_PAIRS,
     MOBILE_ONLY_BROWSERS,
@@ -16,29 +17,66 @@ from ..settings import (
 from .extractor_name_version import NameVersionExtractor
 from .extractor_whole_name import WholeNameExtractor
 
-DATE_VERSION = RegexLazy(r'^202[0-5]')
+DATE_VERSION_PREFIXES = frozenset(('2020', '2021', '2022', '2023', '2024', '2025'))
+
+
+# The engine version regexes only need atomic groups, which the stdlib re
+# module supports since python 3.11, so use it over the slower regex module.
+# The yaml regexes are still compiled with the regex module via RegexLazy.
+@lru_cache(maxsize=None)
+def _compiled_engine_regex(engine: str) -> re.Pattern:
+    """
+    Compile the engine version regex once per engine name.
+
+    The atomic group keeps the version alternation from
+    backtracking on long runs of digits and dots.
+    """
+    return re.compile(
+        BOUNDED_REGEX.format(
+            r"{engine}(?P<sep>\s*\/?\s*)(?P<ver>(?>\d+(?:\.\d+)+|\d{{1,7}}))(?!\d)".format(
+                engine=engine
+            )
+        ),
+        re.IGNORECASE,
+    )
+
+
+# Engine names are a small fixed set, so compile them all up front
+for _engine in AVAILABLE_ENGINES:
+    _compiled_engine_regex(_engine)
+
+
+def parse_engine_version(user_agent: str, engine: str) -> str:
+    """
+    Extract the version of the named engine from the UA string.
+
+    Only versions following a slash are returned, so that model
+    names like "motorola edge 20" aren't read as engine versions.
+    """
+    if not engine:
+        return ''
+
+    # cheap substring check before running the regex
+    if engine.lower() not in user_agent.lower():
+        return ''
+
+    if match := _compiled_engine_regex(engine).search(user_agent):
+        if '/' in match['sep']:
+            return match['ver']
+
+    return ''
 
 
 class EngineVersion:
+    """
+    Kept for backwards compatibility, use parse_engine_version instead
+    """
+
     def __init__(self, user_agent: str):
         self.user_agent = user_agent
 
     def parse(self, engine: str) -> str:
-        if not engine:
-            return ''
-
-        engine_regex = BOUNDED_REGEX.format(
-            r"{engine}\s*\/?\s*((?=\d+\.\d)\d+[.\d]*|\d{{1,7}}(?=(?:\D|$)))".format(engine=engine)
-        )
-        match = regex.search(engine_regex, self.user_agent, regex.IGNORECASE)
-        if match:
-            engine_version = self.user_agent[match.start() : match.end()]
-            try:
-                return engine_version.split('/')[1]
-            except IndexError:
-                pass
-
-        return ''
+        return parse_engine_version(self.user_agent, engine)
 
 
 class Engine(BaseClientParser):
@@ -52,10 +90,9 @@ class Engine(BaseClientParser):
     def _parse(self) -> None:
         super()._parse()
         if 'name' in self.ua_data:
-            self.ua_data['engine_version'] = EngineVersion(
+            self.ua_data['engine_version'] = parse_engine_version(
                 self.user_agent,
-            ).parse(
-                engine=self.ua_data['name'],
+                self.ua_data['name'],
             )
 
 
@@ -71,6 +108,7 @@ class Browser(BaseClientParser):
     AVAILABLE_ENGINES = AVAILABLE_ENGINES
     AVAILABLE_BROWSERS = AVAILABLE_BROWSERS
     BROWSER_TO_ABBREV = BROWSER_TO_ABBREV
+    BROWSER_NAME_TO_ABBREV = BROWSER_NAME_TO_ABBREV
     BROWSER_FAMILIES = BROWSER_FAMILIES
     FAMILY_FROM_ABBREV = FAMILY_FROM_ABBREV
     MOBILE_ONLY_BROWSERS = MOBILE_ONLY_BROWSERS
@@ -91,8 +129,9 @@ class Browser(BaseClientParser):
         # if the name <= 2 characters, don't consider it interesting
         # if that name is actually interesting, add to relevant
         # appdetails/<file>.yml, so it'll be parsed before now.
+        # code is the lowercased, spaceless name, so no need to lowercase again
         for code, name, version in self.name_version_pairs():
-            if len(name) > 2 and not name.lower().endswith(('build', 'version')):
+            if len(name) > 2 and not code.endswith(('build', 'version')):
                 return True
         return False
 
@@ -106,27 +145,29 @@ class Browser(BaseClientParser):
         Save UA data before overriding with Client Hints,
         to restore UA in some cases.
         """
-        if not (ch := self.client_hints):
+        # nothing to merge if the client hints have no client data
+        if not self._has_hints or not (ch := self.client_hints):
             return
 
         ch_data = ch.client_data()
-        if not self.ua_data and ch.client_is_browser():
+        ua_data = self.ua_data
+        if not ua_data and ch.client_is_browser():
             self.ua_data = ch_data
             return
 
         if ch_data.get('app_id'):
-            self.ua_data |= ch_data
+            ua_data |= ch_data
             return
 
         ch_name = ch_data.get('name') or ''
         ch_version = ch_data.get('version') or ''
-        ua_name = self.ua_data.get('name', '')
-        ua_short_name = self.ua_data.get('short_name', '')
+        ua_name = ua_data.get('name', '')
+        ua_short_name = ua_data.get('short_name', '')
 
         if ch_name == 'DuckDuckGo Privacy Browser':
             super().set_data_from_client_hints()
-            self.ua_data['version'] = ''
-            self.ua_data['engine_version'] = ch_version
+            ua_data['version'] = ''
+            ua_data['engine_version'] = ch_version
             return
 
         # If client hints report Chromium, but user agent
@@ -139,22 +180,20 @@ class Browser(BaseClientParser):
         ):
             # If the version reported from the client hints is YYYY or YYYY.MM,
             # then it is the Iridium browser, based on Chromium
-            if DATE_VERSION.search(ch_version):
-                self.ua_data['name'] = 'Iridium'
-                self.ua_data['short_name'] = 'I1'
+            if ch_version[:4] in DATE_VERSION_PREFIXES:
+                ua_data.update(name='Iridium', short_name='I1')
                 return
 
-            self.ua_data['name'] = ua_name
-            self.ua_data['version'] = self.ua_data.get('version', '')
-            self.ua_data['short_name'] = ua_short_name
+            # keep the UA data, but make sure the keys are present
+            ua_data.setdefault('version', '')
+            ua_data.setdefault('short_name', '')
             return
 
         super().set_data_from_client_hints()
 
         # Fix mobile browser names e.g. Chrome => Chrome Mobile
         if f'{ch_name} Mobile' == ua_name:
-            self.ua_data['name'] = ua_name
-            self.ua_data['short_name'] = ua_short_name
+            ua_data.update(name=ua_name, short_name=ua_short_name)
             return
 
     def short_name(self) -> str:
@@ -169,15 +208,15 @@ class Browser(BaseClientParser):
             'engine': {'default': 'WebKit', 'versions': {28: 'Blink'}},
         }
         """
-        if not self.ua_data.get('engine', ''):
+        if not (engine := self.ua_data.get('engine', '')):
             return
 
         browser = self.ua_data.get('name', '')
-        abbreviation = self.BROWSER_TO_ABBREV.get(browser.lower(), browser)
-        self.ua_data |= {
-            'short_name': abbreviation,
-            'family': self.FAMILY_FROM_ABBREV.get(abbreviation, browser),
-        }
+        abbreviation = self.BROWSER_NAME_TO_ABBREV.get(browser) or self.BROWSER_TO_ABBREV.get(
+            browser.lower(), browser
+        )
+        self.ua_data['short_name'] = abbreviation
+        self.ua_data['family'] = self.FAMILY_FROM_ABBREV.get(abbreviation, browser)
 
         if 'engine' not in self.ua_data:
             self.ua_data['engine'] = (
@@ -193,12 +232,9 @@ class Browser(BaseClientParser):
             return
 
         client_version = self.ch_client_data.get('version', '') or self.ua_data.get('version', '')
-        engine = self.ua_data.get('engine') or {}
         for _, name in engine.get('versions', {}).items():
-            self.ua_data |= {
-                'engine': name,
-                'engine_version': client_version,
-            }
+            self.ua_data['engine'] = name
+            self.ua_data['engine_version'] = client_version
 
     def is_mobile_only(self) -> bool:
         return self.short_name() in self.MOBILE_ONLY_BROWSERS
@@ -242,4 +278,5 @@ __all__ = (
     'Browser',
     'Engine',
     'EngineVersion',
+    'parse_engine_version',
 )
@@ -2167,7 +2167,7 @@ class BaseDeviceParser(Parser):
             if not (matched := model['regex'].search(user_agent)):
                 continue
 
-            self.matched_regex = matched
+            self.matched_groups = matched.groups()
             self.ua_data |= {
                 k: v.strip().replace('_', ' ') for k, v in model.items() if k != 'regex'
             }
@@ -2177,8 +2177,8 @@ class BaseDeviceParser(Parser):
             # i.e. Sony Ericsson should override Sony
             break
 
-        if 'model' in self.ua_data and self.matched_regex:
-            if groups := self.matched_regex.groups():
+        if 'model' in self.ua_data and self.matched_groups is not None:
+            if groups := self.matched_groups:
                 self.ua_data['model'] = ModelExtractor(self.ua_data, groups).extract()
 
         return None
@@ -2197,7 +2197,7 @@ class BaseDeviceParser(Parser):
         """
         Set device data from UA or Client Hints.
         """
-        if self.matched_regex:
+        if self.matched_groups is not None:
             self.extract_model()
 
             self.ua_data |= {
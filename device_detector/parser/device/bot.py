@@ -11,7 +11,7 @@ class Bot(BaseDeviceParser):
     ]
 
     def is_bot(self) -> bool:
-        return self.matched_regex is not None
+        return self.matched_groups is not None
 
     def set_details(self) -> None:
         return super().set_details() if self.is_bot() else None
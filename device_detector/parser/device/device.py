@@ -71,8 +71,8 @@ class Device(BaseDeviceParser):
             if self.known:
                 break
             if matched := ua_data['regex'].search(user_agent):
-                self.matched_regex = matched
-                self.ua_data |= {k: v for k, v in ua_data.items() if k != 'regex'}
+                self.matched_groups = matched.groups()
+                self.ua_data.update(ua_data['_no_regex'])
                 self.known = True
             elif ch_model:
                 main_fixture_dtype = ua_data.get('device')
@@ -85,10 +85,10 @@ class Device(BaseDeviceParser):
                             continue
                         matched = model_data['regex'].search(ch_model)
                         if matched:
-                            self.matched_regex = matched
+                            self.matched_groups = matched.groups()
                             self.known = True
                             ua_data = {
-                                k: v for k, v in ua_data.items() if k != 'regex' and k != 'models'
+                                k: v for k, v in ua_data['_no_regex'].items() if k != 'models'
                             }
                             ua_data['model'] = model_data['model']
                             ua_data['device'] = model_fixture_dtype
@@ -97,8 +97,8 @@ class Device(BaseDeviceParser):
                 elif main_fixture_dtype == self.DEVICE_TYPE and (
                     matched := ua_data['regex'].search(ch_model)
                 ):
-                    self.matched_regex = matched
-                    self.ua_data |= {k: v for k, v in ua_data.items() if k != 'regex'}
+                    self.matched_groups = matched.groups()
+                    self.ua_data.update(ua_data['_no_regex'])
                     self.known = True
         # ------------------------------------------------
 
@@ -152,7 +152,7 @@ class Device(BaseDeviceParser):
         if dtype == DeviceType.FeaturePhone:
             return DeviceType.Smartphone
 
-        if not self.matched_regex:
+        if self.matched_groups is None:
             # All devices containing VR fragment are assumed to be a wearable
             if ANDROID_VRF_FRAGMENT.search(self.user_agent) is not None:
                 return DeviceType.Wearable
@@ -200,7 +200,7 @@ class Device(BaseDeviceParser):
         return None
 
     def check_puffin_device(self) -> DeviceType | None:
-        if self.matched_regex:
+        if self.matched_groups is not None:
             return None
 
         # All devices running Puffin Secure Browser that contain
@@ -236,7 +236,7 @@ class Device(BaseDeviceParser):
             return True
 
         # All devices running Tizen TV or SmartTV are assumed to be a tv
-        if not self.matched_regex and TIZEN_TV_FRAGMENT.search(self.user_agent) is not None:
+        if self.matched_groups is None and TIZEN_TV_FRAGMENT.search(self.user_agent) is not None:
             return True
 
         # All devices containing TV fragment are assumed to be a tv
@@ -263,7 +263,7 @@ class Device(BaseDeviceParser):
         return fragment or os_name == 'Mac' or ' Desktop' in self.user_agent
 
     def device_runs_feature_phone_os(self, os_name: str) -> bool:
-        if not self.matched_regex and os_name == 'Java ME':
+        if self.matched_groups is None and os_name == 'Java ME':
             return True
 
         # All devices running KaiOS are more likely feature phones
@@ -280,7 +280,7 @@ class Device(BaseDeviceParser):
         As most touch enabled devices are tablets and only a smaller part are desktops/notebooks
         we assume that all Windows 8 touch devices are tablets.
         """
-        if self.matched_regex:
+        if self.matched_groups is not None:
             return False
         if os_name == 'Windows RT' or (os_name == 'Windows' and os_version.startswith('8')):
             return TOUCH_FRAGMENT.search(self.user_agent) is not None
@@ -325,7 +325,7 @@ class Device(BaseDeviceParser):
 
         # Set device type to desktop for all devices running a
         # desktop OS that were not detected as another device type
-        if not self.matched_regex and os_family in DESKTOP_OS:
+        if self.matched_groups is None and os_family in DESKTOP_OS:
             return DeviceType.Desktop
 
         if not self.user_agent:
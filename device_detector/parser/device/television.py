@@ -46,6 +46,7 @@ class HbbTv(BaseTvParser):
                 brand_data['models'] = stats['models']
             if 'model' in stats:
                 brand_data['model'] = stats['model']
+            brand_data['_no_regex'] = {k: v for k, v in brand_data.items() if k != 'regex'}
             reg_list.append(brand_data)
 
         DDCache[cache_key] = reg_list
@@ -33,7 +33,7 @@ class VendorFragment(BaseDeviceParser):
         for ua_data in self.regex_list:
             for vendor in ua_data['regexes']:
                 if matched := vendor.search(user_agent):
-                    self.matched_regex = matched
+                    self.matched_groups = matched.groups()
                     self.ua_data = {k: v for k, v in ua_data.items() if k != 'regexes'}
                     self.known = True
 
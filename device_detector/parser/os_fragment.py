@@ -31,7 +31,7 @@ class OSFragment(BaseDeviceParser):
                 matched = regex.search(self.user_agent)
 
                 if matched:
-                    self.matched_regex = matched
+                    self.matched_groups = matched.groups()
                     self.ua_data['name'] = ua_data['name']
                     self.known = True
 
@@ -16,7 +16,7 @@ def build_version(version_str: str, truncation: int = 1) -> str:
     Extract basic version from strings like 10.0.16299.371
 
     >>> build_version('10.0.16299.371')
-    '10'
+    '10.0'
 
     >>> build_version('10')
     '10'
@@ -44,26 +44,27 @@ class Parser(RegexLoader):
 
     __slots__ = (
         'user_agent',
-        'ua',
+        'ua_lower',
         'ua_hash',
         'ua_spaceless',
         'ua_data',
         'app_name',
         'app_name_no_punctuation',
-        'matched_regex',
+        'matched_groups',
+        '_matched_versions',
         'app_version',
         'known',
         'secondary_client',
         'client_hints',
         'ch_client_data',
+        '_has_hints',
         'os_details',
-        'appdetails_data',
     )
 
     def __init__(
         self,
         ua: str,
-        ua_hash: str,
+        ua_hash: int,
         ua_spaceless: str,
         client_hints: ClientHints | None,
         os_details: dict | None = None,
@@ -71,38 +72,63 @@ class Parser(RegexLoader):
         super().__init__()
 
         self.user_agent = ua
+        self.ua_lower = ua.lower()
         self.ua_hash = ua_hash
         self.ua_spaceless = ua_spaceless
         self.ua_data: dict = {}
         self.app_name = ''
         self.app_name_no_punctuation = ''
-        self.matched_regex = None
+        self.matched_groups: tuple | None = None
+        self._matched_versions: list = []
         self.app_version = ''
         self.known = False
         self.secondary_client: dict = {}
         self.client_hints = client_hints
         self.ch_client_data = client_hints.client_data() if client_hints else {}
+        self._has_hints = bool(self.ch_client_data)
         self.os_details = os_details or {}
-        self.appdetails_data = app_pretty_names_types_data()
+
+    @property
+    def appdetails_data(self) -> dict:
+        """App details are loaded once and shared by all parsers"""
+        return app_pretty_names_types_data()
 
     def get_from_cache(self) -> dict:
-        try:
-            return DDCache['user_agents'][self.ua_hash].get(self.cache_name, None)
-        except KeyError:
-            DDCache['user_agents'][self.ua_hash] = {}
-        return {}
+        return DDCache['user_agents'].get((self.ua_hash, self.cache_name), None)
 
     def add_to_cache(self) -> dict:
-        DDCache['user_agents'][self.ua_hash][self.cache_name] = self.ua_data
+        DDCache['user_agents'][(self.ua_hash, self.cache_name)] = self.ua_data
         return self.ua_data
 
+    def candidate_regexes(self) -> list:
+        """
+        Entries of regex_list whose required literals are
+        found in the UA string, in their original order.
+        """
+        regex_list = self.regex_list
+        regex_buckets = DDCache['regex_buckets'].get(self.cache_name)
+
+        # Non-ascii chars may casefold to ascii literals, so check all regexes
+        if not regex_buckets or not self.user_agent.isascii():
+            return regex_list
+
+        buckets, unbucketed = regex_buckets
+        ua_lower = self.ua_lower
+        candidates = set(unbucketed)
+        for literal, indexes in buckets.items():
+            if literal in ua_lower:
+                candidates.update(indexes)
+
+        return [regex_list[idx] for idx in sorted(candidates)]
+
     def _parse(self) -> None:
         """Override on subclasses if custom parsing is required"""
         user_agent = self.user_agent
-        for ua_data in self.regex_list:
+        for ua_data in self.candidate_regexes():
             if matched := ua_data['regex'].search(user_agent):
-                self.matched_regex = matched
-                self.ua_data |= {k: v for k, v in ua_data.items() if k != 'regex'}
+                self.matched_groups = matched.groups()
+                self.ua_data.update(ua_data['_no_regex'])
+                self._matched_versions = ua_data.get('versions', [])
                 self.known = True
                 return
 
@@ -134,9 +160,9 @@ class Parser(RegexLoader):
         See oss.yml for example file structure.
         """
 
-        for version in self.ua_data.pop('versions', []):
-            if version['regex'].search(self.user_agent):
-                self.ua_data['version'] = version['version']
+        for version_regex, version in self._matched_versions:
+            if version_regex.search(self.user_agent):
+                self.ua_data['version'] = version
                 return
 
     def set_details(self) -> None:
@@ -145,7 +171,7 @@ class Parser(RegexLoader):
 
         Update fields with interpolated values from regex data
         """
-        groups = self.matched_regex and self.matched_regex.groups() or None
+        groups = self.matched_groups
         if groups:
             if 'name' in self.ua_data:
                 self.ua_data['name'] = NameExtractor(self.ua_data, groups).extract()
@@ -1058,6 +1058,8 @@ AVAILABLE_BROWSERS = {
 
 # flip Abbrev / Name for fast membership testing
 BROWSER_TO_ABBREV = {browser.lower(): abbrev for abbrev, browser in AVAILABLE_BROWSERS.items()}
+# same, but keyed by exact name, so matched names needn't be lowercased
+BROWSER_NAME_TO_ABBREV = {browser: abbrev for abbrev, browser in AVAILABLE_BROWSERS.items()}
 
 # fmt: off
 BROWSER_FAMILIES = {
@@ -1123,7 +1125,7 @@ for b, codes in BROWSER_FAMILIES.items():
     for code in codes:
         FAMILY_FROM_ABBREV[code] = b.lower()
 
-MOBILE_ONLY_BROWSERS = {
+MOBILE_ONLY_BROWSERS = frozenset({
     '36', 'AH', 'AI', 'BL', 'C1', 'C4', 'CB', 'CW', 'DB',
     '3M', 'DT', 'EU', 'EZ', 'FK', 'FM', 'FR', 'FX', 'GH',
     'GI', 'GR', 'HA', 'HU', 'IV', 'JB', 'KD', 'M1', 'MF',
@@ -1148,7 +1150,7 @@ MOBILE_ONLY_BROWSERS = {
     '9P', 'N8', 'VR', 'N9', 'M9', 'F9', '0P', '0A', '2F',
     '2M', 'K7', '1N', '8A', 'H7', 'X3', 'X4', '5O', '6I',
     '7I', 'X5', '3P', '2E',
-}
+})
 # fmt: off
 
 TV_CLIENTS = {
@@ -1236,12 +1238,12 @@ SKIP_PREFIXES = set(AVAILABLE_ENGINES_LOWER_CASE.keys()) | \
                 CRUFT_NAMES | \
                 set(BROWSER_TO_ABBREV.keys())
 
-CHECK_PAIRS = {
+CHECK_PAIRS = frozenset({
     'Android Browser',
     'Mobile Safari',
     'Chrome Mobile',
     'Chrome',
-}
+})
 
 
 def normalized_name(name: str, abbreviations: dict, names: dict) -> str:
@@ -1273,6 +1275,7 @@ __all__ = (
     'AVAILABLE_BROWSERS',
     'BROWSER_FAMILIES',
     'BROWSER_TO_ABBREV',
+    'BROWSER_NAME_TO_ABBREV',
     'FAMILY_FROM_ABBREV',
     'CHECK_PAIRS',
     'CRUFT_NAMES',
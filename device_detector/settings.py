@@ -6,6 +6,10 @@ from typing import Any
 # Only match if useragent begins with given regex or there is no letter before it
 BOUNDED_REGEX = r'(?:^|[^A-Z0-9_-]|[^A-Z0-9-]_|sprd-|MZ-)(?:{})'
 MAX_CACHE_SIZE = 1024
+# Parsed data is cached per (ua_hash, parser name), one key for each
+# parser run on the UA, plus name_version_pairs and the parsed result
+MAX_CACHE_KEYS_PER_UA = 26
+MAX_PARSE_CACHE_SIZE = MAX_CACHE_SIZE * MAX_CACHE_KEYS_PER_UA
 
 
 class LRUDict(OrderedDict):
@@ -45,6 +49,12 @@ class LRUDict(OrderedDict):
             pass
         return value
 
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return super().__getitem__(key)
+
     def __setitem__(self, key: Any, value: Any) -> None:
         super().__setitem__(key, value)
         self.purge()
@@ -54,11 +64,12 @@ class Cache(dict):
     base: dict = {
         'appdetails': {},
         'regexes': {},
+        'regex_buckets': {},
         'normalize_regexes': [],
         'appids_ignored': set(),
         'appids_secondary': set(),
         'appids_normalized': {},
-        'user_agents': LRUDict(),
+        'user_agents': LRUDict(maxkeys=MAX_PARSE_CACHE_SIZE),
     }
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -1,5 +1,6 @@
 from ..base import ParserBaseTest
 from ...device_detector import DeviceDetector
+from ...settings import LRUDict
 
 
 class TestCache(ParserBaseTest):
@@ -48,6 +49,18 @@ class TestCache(ParserBaseTest):
         second_run = DeviceDetector(ua).parse()
         self.assertEqual(second_run.os_name(), 'Ubuntu')
 
+    def test_lru_get_marks_key_used(self):
+        cache = LRUDict(maxkeys=2)
+        cache['first'] = 1
+        cache['second'] = 2
+
+        # reading the oldest key should protect it from eviction
+        self.assertEqual(cache.get('first'), 1)
+        cache['third'] = 3
+
+        self.assertEqual(list(cache), ['first', 'third'])
+        self.assertIsNone(cache.get('second'))
+
 
 __all__ = [
     'TestCache',
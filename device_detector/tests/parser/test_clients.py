@@ -1,3 +1,4 @@
+from unittest import TestCase
 from urllib.parse import unquote
 from device_detector.parser import ClientHints
 from ...utils import ua_hash
@@ -5,6 +6,7 @@ from ..base import GenericParserTest, ParserBaseTest
 from ...parser import (
     Browser,
     DictUA,
+    EngineVersion,
     FeedReader,
     Library,
     MediaPlayer,
@@ -12,6 +14,7 @@ from ...parser import (
     PIM,
     NameVersionExtractor,
     WholeNameExtractor,
+    parse_engine_version,
 )
 
 
@@ -147,6 +150,33 @@ class TestWholeNameExtractor(GenericParserTest):
     ]
 
 
+class TestEngineVersion(TestCase):
+
+    def test_engine_version(self):
+        for ua, engine, version in (
+            ('Mozilla/5.0 Gecko/20100101 Goanna/4.1 PaleMoon/28.5.0', 'Goanna', '4.1'),
+            ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Blink/120', 'Blink', '120'),
+            ('Mozilla/5.0 (SymbianOS/9.2) Profile/MIDP-2.0/NetFront/3.5', 'NetFront', '3.5'),
+            ('Opera/9.80 (Windows NT 6.1) Presto/2.12.388 Version/12.16', 'presto', '2.12.388'),
+        ):
+            self.assertEqual(parse_engine_version(ua, engine), version, msg=ua)
+
+    def test_no_engine_version(self):
+        for ua, engine in (
+            # model names and numbers not separated by a slash aren't versions
+            ('Mozilla/5.0 (Linux; Android 11; motorola edge 20) Chrome/96.0', 'Edge'),
+            ('Mozilla/5.0 (SmartHub; SMART-TV; Maple2012) AppleWebKit/534.7', 'Maple'),
+            ('Opera/9.80 (Linux mips; U; O+ Presto 700) Presto', 'Presto'),
+            ('Mozilla/5.0 (Windows NT 10.0) Gecko/20100101 Firefox/91.0', 'Gecko'),
+            ('Mozilla/5.0 (Windows NT 10.0) Trident/7.0', ''),
+        ):
+            self.assertEqual(parse_engine_version(ua, engine), '', msg=ua)
+
+    def test_engine_version_wrapper(self):
+        ua = 'Opera/9.80 (Windows NT 6.1) Presto/2.12.388 Version/12.16'
+        self.assertEqual(EngineVersion(ua).parse('Presto'), '2.12.388')
+
+
 # class TestNoNameExtracted(ParserBaseTest):
 #
 #     fixture_files = [
@@ -176,5 +206,6 @@ __all__ = (
     'TestPIM',
     'TestNameVersionExtractor',
     'TestWholeNameExtractor',
+    'TestEngineVersion',
     # 'TestNoNameExtracted',
 )
@@ -14,6 +14,20 @@ class TestOS(ParserBaseTest):
     fixture_key = 'os'
     Parser = OS
 
+    def test_first_matching_version(self):
+        # matches both the 'Android 12\.1' and later 'Android 12' version regexes
+        user_agent = 'Mozilla/5.0 (Linux; Android 12.1; lineage_walleye) AppleWebKit/537.36'
+        parsed = OS(
+            user_agent,
+            ua_hash(user_agent),
+            user_agent.lower().replace(' ', ''),
+            client_hints=None,
+        ).clear_cache().parse()
+
+        self.assertEqual(parsed.ua_data['name'], 'Lineage OS')
+        self.assertEqual(parsed.ua_data['version'], '19.1')
+        self.assertNotIn('versions', parsed.ua_data)
+
 
 class TestOSFragment(ParserBaseTest):
 
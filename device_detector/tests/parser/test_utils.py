@@ -5,6 +5,7 @@ from device_detector.utils import (
     only_numerals_and_punctuation,
     mostly_numerals,
     random_alphanumeric_string,
+    required_literals,
     uuid_like_name,
 )
 
@@ -316,3 +317,35 @@ class TestNotRepeatingCharacters(TestCase):
                 mostly_repeating_characters(ua),
                 msg='%s is not mostly repeating characters' % ua,
             )
+
+
+class TestRequiredLiterals(TestCase):
+
+    def test_required_literals(self):
+        for pattern, literals in (
+                (r'Chrome/(\d+[\.\d]+)', ('chrome',)),
+                (r'Opera Mini(?:/att)?/?(\d+[\.\d]+)', ('opera',)),
+                (r'Fire(?:fox)?/(\d+)|Iceweasel', ('fire', 'iceweasel')),
+                (r'[)]Kylo/(\d+)', ('kylo',)),
+                (r'Sa{2,3}fari', ('fari',)),
+                (r'Safari?', ('safar',)),
+        ):
+            self.assertEqual(
+                required_literals(pattern),
+                literals,
+                msg='%s requires %s' % (pattern, literals),
+            )
+
+    def test_no_required_literals(self):
+        for pattern in (
+                r'(?:Edge|Edg)/(\d+)',
+                r'Chrome/(\d+)|(?:Edg)',
+                r'(\w+)/\1',
+                r'[a-z]+/(\d+)',
+                r'Foo{bar|Baz',
+        ):
+            self.assertEqual(
+                required_literals(pattern),
+                (),
+                msg='%s has no required literals' % pattern,
+            )
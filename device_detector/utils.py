@@ -1,5 +1,4 @@
 from collections import Counter
-from hashlib import blake2s
 from string import punctuation
 from urllib.parse import unquote
 from .enums import AppType
@@ -73,10 +72,12 @@ INTEGER = RegexLazyIgnore(r"\d")
 MIN_WORD_LENGTH = 7
 
 
-def ua_hash(user_agent: str, headers: dict | None = None) -> str:
+def ua_hash(user_agent: str, headers: dict | None = None) -> int:
     """
-    Return short hash of User Agent string for
-    memory-efficient cache key.
+    Return hash of User Agent string for memory-efficient cache key.
+
+    Computed once per DeviceDetector and passed on to every parser. The
+    cache only lives in this process, so the builtin hash is sufficient.
     """
     if headers:
         try:
@@ -86,7 +87,7 @@ def ua_hash(user_agent: str, headers: dict | None = None) -> str:
     else:
         cache_key = user_agent
 
-    return blake2s(cache_key.encode('utf-8')).hexdigest()
+    return hash(cache_key)
 
 
 def long_ua_no_punctuation(user_agent: str) -> bool:
@@ -379,6 +380,89 @@ def uuid_like_name(value: str) -> bool:
     return False
 
 
+def required_literals(pattern: str) -> tuple[str, ...]:
+    r"""
+    Lowercase alphanumeric literals, one per top level alternative of the
+    pattern, of which at least one must be present in any matching string.
+
+    Returns an empty tuple if any alternative has no such literal, meaning
+    the regex must always be searched.
+
+    >>> required_literals(r'Chrome/(\d+[\.\d]+)')
+    ('chrome',)
+
+    >>> required_literals(r'Fire(?:fox)?/(\d+)|Iceweasel')
+    ('fire', 'iceweasel')
+
+    >>> required_literals(r'(?:Edge|Edg)/(\d+)')
+    ()
+    """
+    branches = []
+    best = run = ''
+    depth = 0
+    i = 0
+    length = len(pattern)
+
+    while i < length:
+        char = pattern[i]
+        is_literal = False
+
+        if char == '\\':
+            escaped = pattern[i + 1 : i + 2]
+            # backreferences, \x41, \p{L} etc are too involved to analyze
+            if escaped.isalnum() and escaped not in 'dDsSwWbB':
+                return ()
+            i += 2
+        elif char == '[':
+            # skip the character class. A ']' right after '[' or '[^' is literal
+            i += 1
+            if pattern[i : i + 1] == '^':
+                i += 1
+            if pattern[i : i + 1] == ']':
+                i += 1
+            while i < length and pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            i += 1
+        elif char == '{':
+            # repetition applies to the preceding character
+            run = run[:-1]
+            end = pattern.find('}', i)
+            # an unclosed brace is a literal, too involved to analyze
+            if end == -1:
+                return ()
+            i = end + 1
+        elif char in '?*+':
+            run = run[:-1]
+            i += 1
+        elif char == '(':
+            depth += 1
+            i += 1
+        elif char == ')':
+            depth -= 1
+            i += 1
+        elif char == '|' and depth == 0:
+            branches.append(max(best, run, key=len))
+            best = run = ''
+            i += 1
+            continue
+        else:
+            is_literal = depth == 0 and char.isascii() and char.isalnum()
+            i += 1
+
+        if is_literal:
+            run += char.lower()
+        else:
+            best = max(best, run, key=len)
+            run = ''
+
+    branches.append(max(best, run, key=len))
+
+    if not all(len(branch) > 1 for branch in branches):
+        return ()
+
+    return tuple(dict.fromkeys(branches))
+
+
 def calculate_dtype(app_name: str) -> AppType:
     """
     For generic extractors try to return a more
@@ -407,5 +491,6 @@ __all__ = (
     'clean_ua',
     'mostly_repeating_characters',
     'random_alphanumeric_string',
+    'required_literals',
     'uuid_like_name',
 )
@@ -7,10 +7,12 @@ except ImportError:
     from yaml import SafeLoader  # type: ignore[assignment]
 from pathlib import Path
 from typing import Self
+from urllib.parse import unquote
 
 import device_detector
 from .lazy_regex import RegexLazyIgnore
 from .settings import BOUNDED_REGEX, DDCache, ROOT
+from .utils import required_literals
 from device_detector.enums import AppType
 
 
@@ -81,15 +83,36 @@ class RegexLoader:
         for fixture in self.fixture_files:
             regexes.extend(self.yaml_to_list(f'regexes/{fixture}'))
 
-        for regex in regexes:
+        # Index regexes by the literal substrings they require, so
+        # only regexes whose literals are in the UA need to be searched.
+        buckets: dict = defaultdict(list)
+        unbucketed = []
+
+        for idx, regex in enumerate(regexes):
             if 'regex' in regex:
+                literals = required_literals(unquote(str(regex['regex'])))
+                for literal in literals:
+                    buckets[literal].append(idx)
+                if not literals:
+                    unbucketed.append(idx)
                 regex['regex'] = RegexLazyIgnore(BOUNDED_REGEX.format(regex['regex']))
+            else:
+                unbucketed.append(idx)
             for model in regex.get('models', []):
                 model['regex'] = RegexLazyIgnore(BOUNDED_REGEX.format(model['regex']))
-            for version in regex.get('versions', []):
-                version['regex'] = RegexLazyIgnore(BOUNDED_REGEX.format(version['regex']))
+            if versions := regex.get('versions', []):
+                regex['versions'] = [
+                    (RegexLazyIgnore(BOUNDED_REGEX.format(version['regex'])), version['version'])
+                    for version in versions
+                ]
+            if 'regex' in regex:
+                # copied into Parser.ua_data on match
+                regex['_no_regex'] = {
+                    k: v for k, v in regex.items() if k not in ('regex', 'versions')
+                }
 
         DDCache['regexes'][self.cache_name] = regexes
+        DDCache['regex_buckets'][self.cache_name] = (dict(buckets), unbucketed)
 
         return regexes
 